@@ -0,0 +1,59 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled fast path for filter_strings_starting_with_e
+Build in place with: CFLAGS="-O3 -march=native" cythonize -i -3 _filter_e.pyx
+"""
+
+from cpython.list cimport PyList_New, PyList_SET_ITEM
+from cpython.ref cimport Py_INCREF
+
+cdef extern from "Python.h":
+    void Py_SET_SIZE(object o, Py_ssize_t size)
+    bint PyUnicode_Check(object o)
+    Py_ssize_t PyUnicode_GET_LENGTH(object o)
+    Py_UCS4 PyUnicode_READ_CHAR(object o, Py_ssize_t index)
+
+
+cpdef list filter_starts_e(list sl):
+    """
+    Return the non-empty strings in sl whose first character is 'E' or 'e'
+    
+    Args:
+        sl (list): List of strings to filter (None and empty entries are skipped)
+        
+    Returns:
+        list: Strings that begin with "E" (case-insensitive)
+    """
+    cdef Py_ssize_t i, k = 0, n = len(sl)
+    cdef object s
+    cdef Py_UCS4 c
+    cdef bint generic = False
+    # Pre-size to the upper bound; the unused tail is cut off by shrinking ob_size
+    # before the exact-size copy is returned.
+    # The loop makes no Python-level calls, so sl cannot change size underneath it.
+    cdef list out = PyList_New(n)
+    try:
+        for i in range(n):
+            s = sl[i]
+            if s is None:
+                continue
+            if not PyUnicode_Check(s):
+                # Not a str (or str subclass): use the pure-Python rule below
+                generic = True
+                break
+            if PyUnicode_GET_LENGTH(s) == 0:
+                continue
+            # Read the first code point directly: no slice, no .upper()
+            c = PyUnicode_READ_CHAR(s, 0)
+            if c == u'E' or c == u'e':
+                Py_INCREF(s)
+                PyList_SET_ITEM(out, k, s)
+                k += 1
+    finally:
+        Py_SET_SIZE(out, k)
+    if generic:
+        # Same expression as the pure-Python filter_strings_starting_with_e
+        return [item for item in sl if item and item[0].upper() == 'E']
+    # Shrinking ob_size keeps the full n-slot buffer; hand back an exact-size copy
+    return out[:k]
+
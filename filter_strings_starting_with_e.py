@@ -4,6 +4,14 @@ Reusable string filtering utilities using predicates
 Requirements: No built-in reduce APIs
 """
 
+from functools import lru_cache
+from itertools import compress
+
+try:
+    import _filter_e
+except ImportError:  # Cython extension not built; see _filter_e.pyx
+    _filter_e = None
+
 class StringFilter:
     """A reusable class for filtering strings based on predicate functions"""
     
@@ -19,11 +27,8 @@ class StringFilter:
         Returns:
             list: Strings for which predicate returns True
         """
-        result = []
-        for string in string_list:
-            if string and predicate(string):  # Only test non-empty strings
-                result.append(string)
-        return result
+        # filter(None, ...) drops empty/None entries in C before the predicate runs
+        return [string for string in filter(None, string_list) if predicate(string)]
     
     @staticmethod
     def filter_by_starting_character(string_list, character, case_sensitive=False):
@@ -44,13 +49,8 @@ class StringFilter:
         if not isinstance(character, str) or len(character) != 1:
             raise ValueError("Character must be a single character string")
         
-        def starts_with_char(s):
-            if case_sensitive:
-                return s[0] == character
-            else:
-                return s[0].upper() == character.upper()
-        
-        return StringFilter.filter_by_predicate(string_list, starts_with_char)
+        # bool() keeps the cache key hashable for any truthy/falsy flag value
+        return _make_starting_character_filter(character, bool(case_sensitive))(string_list)
     
     @staticmethod
     def filter_by_ending_character(string_list, character, case_sensitive=False):
@@ -58,11 +58,15 @@ class StringFilter:
         if not isinstance(character, str) or len(character) != 1:
             raise ValueError("Character must be a single character string")
         
-        def ends_with_char(s):
-            if case_sensitive:
+        # Pick the specialized predicate once rather than branching per element
+        if case_sensitive:
+            def ends_with_char(s):
                 return s[-1] == character
-            else:
-                return s[-1].upper() == character.upper()
+        else:
+            target = character.upper()
+            
+            def ends_with_char(s):
+                return s[-1].upper() == target
         
         return StringFilter.filter_by_predicate(string_list, ends_with_char)
     
@@ -79,13 +83,12 @@ class StringFilter:
     @staticmethod
     def filter_by_contains(string_list, substring, case_sensitive=False):
         """Filter strings by substring using predicate approach"""
-        def contains_predicate(s):
-            if case_sensitive:
-                return substring in s
-            else:
-                return substring.upper() in s.upper()
+        if case_sensitive:
+            return [s for s in filter(None, string_list) if substring in s]
         
-        return StringFilter.filter_by_predicate(string_list, contains_predicate)
+        # Upper-case the substring once; only each element is mapped per iteration
+        sub_u = substring.upper()
+        return [s for s in filter(None, string_list) if sub_u in s.upper()]
     
     @staticmethod
     def combine_predicates_and(pred1, pred2):
@@ -103,6 +106,96 @@ class StringFilter:
         return lambda x: not predicate(x)
 
 
+# ============================================
+# Internal Helpers
+# ============================================
+
+@lru_cache(maxsize=256)
+def _make_starting_character_filter(character, case_sensitive):
+    """
+    Generate (once per character/case pair) a filter function with the
+    comparison character baked into its bytecode as a constant
+    """
+    # Resolve case handling once instead of per element
+    if case_sensitive:
+        condition = f"s[0] == {character!r}"
+    else:
+        condition = f"s[0].upper() == {character.upper()!r}"
+    src = (
+        "def starting_character_filter(string_list):\n"
+        f"    return [s for s in filter(None, string_list) if {condition}]\n"
+    )
+    namespace = {}
+    exec(src, namespace)
+    return namespace['starting_character_filter']
+
+
+# ============================================
+# Cached First-Character Filtering
+# ============================================
+
+class FilterableList:
+    """
+    A list of strings that caches the first character of each entry as a byte
+    so repeated starting-character filters scan a compact bytes object
+    """
+    
+    def __init__(self, string_list):
+        self._items = list(string_list)
+        self._first_bytes = {}
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def __iter__(self):
+        return iter(self._items)
+    
+    def _first_char_bytes(self, case_sensitive):
+        """
+        Build (once per mode) one byte per entry: the first character, upper-cased
+        unless case_sensitive, when that is a single ASCII character; otherwise 0
+        """
+        codes = self._first_bytes.get(case_sensitive)
+        if codes is None:
+            codes = bytearray(len(self._items))
+            for i, s in enumerate(self._items):
+                if s:
+                    first = s[0] if case_sensitive else s[0].upper()
+                    if len(first) == 1 and ord(first) < 128:
+                        codes[i] = ord(first)
+            codes = self._first_bytes[case_sensitive] = bytes(codes)
+        return codes
+    
+    def filter_by_starting_character(self, character, case_sensitive=False):
+        """
+        Filter strings by starting character using the cached first-character bytes
+        
+        Args:
+            character (str): The character to filter by (single character)
+            case_sensitive (bool): Whether the comparison should be case-sensitive
+            
+        Returns:
+            list: List of strings that begin with the specified character
+            
+        Raises:
+            ValueError: If character is not a single character
+        """
+        if not isinstance(character, str) or len(character) != 1:
+            raise ValueError("Character must be a single character string")
+        
+        case_sensitive = bool(case_sensitive)
+        target = character if case_sensitive else character.upper()
+        if len(target) != 1 or not 0 < ord(target) < 128:
+            # The cache only records ASCII first characters (0 marks empty/non-ASCII)
+            return StringFilter.filter_by_starting_character(self._items, character, case_sensitive)
+        
+        # Map the target byte to 1 and everything else to 0, then select in C
+        table = bytearray(256)
+        table[ord(target)] = 1
+        mask = self._first_char_bytes(case_sensitive).translate(table)
+        return list(compress(self._items, mask))
+
+
 # ============================================
 # Predicate Functions for Common Use Cases
 # ============================================
@@ -125,9 +218,15 @@ def is_shorter_than_4(text):
 
 def contains_double_letters(text):
     """Predicate: Does text contain consecutive identical letters?"""
-    for i in range(len(text) - 1):
-        if text[i].upper() == text[i + 1].upper():
+    upper = text.upper()
+    if len(upper) != len(text):
+        # Some character expands when upper-cased (e.g. 'ß'); keep a per-character mapping
+        upper = [char.upper() for char in text]
+    previous = None
+    for char in upper:
+        if char == previous:
             return True
+        previous = char
     return False
 
 def has_uppercase_letters(text):
@@ -139,10 +238,8 @@ def has_uppercase_letters(text):
 
 def is_all_alphabetic(text):
     """Predicate: Does text contain only alphabetic characters?"""
-    for char in text:
-        if not char.isalpha():
-            return False
-    return True
+    # str.isalpha() is False for '', which previously counted as all-alphabetic
+    return text.isalpha() or not text
 
 
 # ============================================
@@ -160,7 +257,10 @@ def filter_strings_starting_with_e(string_list):
     Returns:
         list: List of strings that begin with "E"
     """
-    return StringFilter.filter_by_predicate(string_list, starts_with_e)
+    if _filter_e is not None and isinstance(string_list, list):
+        return _filter_e.filter_starts_e(string_list)
+    # Same rule as the compiled fallback in _filter_e.filter_starts_e
+    return [s for s in string_list if s and s[0].upper() == 'E']
     
 
 def main():
@@ -281,6 +381,12 @@ def main():
         result = StringFilter.filter_by_starting_character(method_test, char)
         print(f"   Starting with '{char}': {result}")
     
+    # Reuse one FilterableList across several starting-character filters
+    cached_test = FilterableList(method_test)
+    for char in ['A', 'B', 'C']:
+        result = cached_test.filter_by_starting_character(char)
+        print(f"   Starting with '{char}' (cached): {result}")
+    
     # Test ending characters
     ending_test = ["Apple", "Orange", "Grape", "Banana", "Cherry"]
     print(f"\nEnding test list: {ending_test}")
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the string filtering utilities
+"""
+
+import sys
+import unittest
+from unittest import mock
+
+import filter_strings_starting_with_e as filter_module
+from filter_strings_starting_with_e import (
+    FilterableList,
+    StringFilter,
+    _filter_e,
+    contains_double_letters,
+    filter_strings_starting_with_e,
+    has_uppercase_letters,
+    is_all_alphabetic,
+    is_longer_than_5,
+    is_shorter_than_4,
+    starts_with_e,
+    starts_with_vowel,
+)
+
+
+class TestCaseInsensitiveCharacterFilters(unittest.TestCase):
+    """Case-insensitive character filters match whatever upper-cases to the same form"""
+    
+    def test_ending_sigma_matches_final_sigma(self):
+        words = ['λόγος', 'κόσμος', 'λέξη']
+        self.assertEqual(StringFilter.filter_by_ending_character(words, 'σ'), ['λόγος', 'κόσμος'])
+        self.assertEqual(StringFilter.filter_by_ending_character(words, 'Σ'), ['λόγος', 'κόσμος'])
+    
+    def test_long_s_matches_s(self):
+        words = ['ſtar', 'star', 'Star', 'tar']
+        self.assertEqual(StringFilter.filter_by_starting_character(words, 'S'), ['ſtar', 'star', 'Star'])
+        self.assertEqual(StringFilter.filter_by_starting_character(words, 'ſ'), ['ſtar', 'star', 'Star'])
+    
+    def test_dotless_i_matches_i(self):
+        words = ['ıx', 'Ix', 'ix', 'x']
+        self.assertEqual(StringFilter.filter_by_starting_character(words, 'i'), ['ıx', 'Ix', 'ix'])
+        self.assertEqual(StringFilter.filter_by_starting_character(words, 'ı'), ['ıx', 'Ix', 'ix'])
+    
+    def test_multi_character_upper_does_not_match_prefix(self):
+        words = ['ßig', 'SSig', 'Sig']
+        self.assertEqual(StringFilter.filter_by_starting_character(words, 'ß'), ['ßig'])
+    
+    def test_unhashable_case_sensitive_flag(self):
+        self.assertEqual(StringFilter.filter_by_starting_character(['apple', 'Apple'], 'a', []),
+                         ['apple', 'Apple'])
+        self.assertEqual(StringFilter.filter_by_starting_character(['apple', 'Apple'], 'a', [1]),
+                         ['apple'])
+    
+    def test_case_sensitive_is_literal(self):
+        words = ['ſtar', 'star', 'Star']
+        self.assertEqual(StringFilter.filter_by_starting_character(words, 's', True), ['star'])
+        self.assertEqual(StringFilter.filter_by_ending_character(['λόγος', 'Σσ'], 'σ', True), ['Σσ'])
+
+
+class TestStringFilterMethods(unittest.TestCase):
+    """Behaviour of the StringFilter convenience methods"""
+    
+    def test_filter_by_contains_case_insensitive(self):
+        words = ["Programming", "Development", "Software", "Hardware", "Network", "WAREhouse"]
+        self.assertEqual(StringFilter.filter_by_contains(words, 'ing'), ["Programming"])
+        self.assertEqual(StringFilter.filter_by_contains(words, 'WARE'),
+                         ["Software", "Hardware", "WAREhouse"])
+    
+    def test_filter_by_contains_case_sensitive(self):
+        words = ["Software", "WAREhouse", "beware"]
+        self.assertEqual(StringFilter.filter_by_contains(words, 'ware', True), ["Software", "beware"])
+        self.assertEqual(StringFilter.filter_by_contains(words, 'WARE', True), ["WAREhouse"])
+    
+    def test_filter_by_contains_skips_empty_entries(self):
+        words = ["", None, "ring", ""]
+        self.assertEqual(StringFilter.filter_by_contains(words, 'ing'), ["ring"])
+        self.assertEqual(StringFilter.filter_by_contains(words, 'ing', True), ["ring"])
+        self.assertEqual(StringFilter.filter_by_contains(words, ''), ["ring"])
+    
+    def test_filter_by_ending_character(self):
+        words = ["Apple", "Orange", "Grape", "Banana", "Cherry", "", None, "ORANGE"]
+        self.assertEqual(StringFilter.filter_by_ending_character(words, 'e'),
+                         ["Apple", "Orange", "Grape", "ORANGE"])
+        self.assertEqual(StringFilter.filter_by_ending_character(words, 'E', True), ["ORANGE"])
+        self.assertEqual(StringFilter.filter_by_ending_character(words, 'a'), ["Banana"])
+    
+    def test_filter_by_ending_character_invalid(self):
+        with self.assertRaises(ValueError):
+            StringFilter.filter_by_ending_character(["Apple"], "le")
+        with self.assertRaises(ValueError):
+            StringFilter.filter_by_ending_character(["Apple"], "")
+
+
+class TestPredicates(unittest.TestCase):
+    """Module-level predicates"""
+    
+    def test_contains_double_letters(self):
+        self.assertTrue(contains_double_letters("Book"))
+        self.assertTrue(contains_double_letters("aA"))
+        self.assertFalse(contains_double_letters("abc"))
+        self.assertFalse(contains_double_letters(""))
+    
+    def test_contains_double_letters_expanding_upper(self):
+        # 'ß' upper-cases to 'SS' but is still compared as a single character
+        self.assertFalse(contains_double_letters("ßa"))
+        self.assertFalse(contains_double_letters("ßs"))
+        self.assertTrue(contains_double_letters("ßß"))
+    
+    def test_has_uppercase_letters(self):
+        self.assertTrue(has_uppercase_letters("Hello"))
+        self.assertFalse(has_uppercase_letters("hello123"))
+        self.assertFalse(has_uppercase_letters(""))
+    
+    def test_is_all_alphabetic(self):
+        self.assertTrue(is_all_alphabetic("Hello"))
+        self.assertFalse(is_all_alphabetic("TEST123"))
+        self.assertTrue(is_all_alphabetic(""))
+
+
+class TestLegacyFilterPurePython(unittest.TestCase):
+    """filter_strings_starting_with_e without the compiled extension"""
+    
+    def setUp(self):
+        patcher = mock.patch.object(filter_module, '_filter_e', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_filters_e_case_insensitively(self):
+        words = ["Eagle", "bird", "", None, "elephant", "ÉE", "E"]
+        self.assertEqual(filter_strings_starting_with_e(words), ["Eagle", "elephant", "E"])
+    
+    def test_str_subclass(self):
+        class Word(str):
+            pass
+        words = [Word("Emu"), Word("cat"), Word("")]
+        self.assertEqual(filter_strings_starting_with_e(words), ["Emu"])
+    
+    def test_non_str_entries(self):
+        self.assertEqual(filter_strings_starting_with_e(["Emu", 0, b"", "echo"]), ["Emu", "echo"])
+        with self.assertRaises(TypeError):
+            filter_strings_starting_with_e(["Emu", 1])
+        with self.assertRaises(AttributeError):
+            filter_strings_starting_with_e(["Emu", b"Eb"])
+
+
+class TestPredicateCombinators(unittest.TestCase):
+    """combine_predicates_and / combine_predicates_or / negate_predicate"""
+    
+    def test_and_or_not(self):
+        vowel_and_long = StringFilter.combine_predicates_and(starts_with_vowel, is_longer_than_5)
+        e_or_short = StringFilter.combine_predicates_or(starts_with_e, is_shorter_than_4)
+        not_vowel = StringFilter.negate_predicate(starts_with_vowel)
+        words = ["Eagle", "Apple", "Banana", "Elephant", "Programming", "Cod"]
+        self.assertEqual(StringFilter.filter_by_predicate(words, vowel_and_long), ["Elephant"])
+        self.assertEqual(StringFilter.filter_by_predicate(words, e_or_short), ["Eagle", "Elephant", "Cod"])
+        self.assertEqual(StringFilter.filter_by_predicate(words, not_vowel), ["Banana", "Programming", "Cod"])
+    
+    def test_chaining_and_mixing(self):
+        def is_even(x):
+            return x % 2 == 0
+        
+        def is_big(x):
+            return x > 10
+        
+        def is_small(x):
+            return x < 3
+        
+        def is_below_20(x):
+            return x < 20
+        chained = StringFilter.combine_predicates_and(
+            StringFilter.combine_predicates_and(is_even, is_big), is_below_20)
+        mixed = StringFilter.combine_predicates_or(
+            StringFilter.combine_predicates_and(is_even, is_big), is_small)
+        self.assertEqual([x for x in range(25) if chained(x)], [12, 14, 16, 18])
+        self.assertEqual([x for x in range(25) if mixed(x)], [0, 1, 2, 12, 14, 16, 18, 20, 22, 24])
+    
+    def test_short_circuit_return_values(self):
+        calls = []
+        
+        def record(value):
+            def predicate(x):
+                calls.append(value)
+                return value
+            return predicate
+        self.assertEqual(StringFilter.combine_predicates_and(record(0), record(1))("x"), 0)
+        self.assertEqual(calls, [0])
+        calls.clear()
+        self.assertEqual(StringFilter.combine_predicates_or(record("hit"), record(1))("x"), "hit")
+        self.assertEqual(calls, ["hit"])
+        calls.clear()
+        self.assertEqual(StringFilter.combine_predicates_or(record(""), record(None))("x"), None)
+        self.assertEqual(calls, ["", None])
+
+
+class TestFilterableList(unittest.TestCase):
+    """FilterableList agrees with StringFilter whether or not its cache is used"""
+    
+    def assertSameAsStringFilter(self, words, character, case_sensitive=False):
+        result = FilterableList(words).filter_by_starting_character(character, case_sensitive)
+        expected = StringFilter.filter_by_starting_character(words, character, case_sensitive)
+        self.assertEqual(result, expected)
+        return result
+    
+    def test_ascii_repeated_filters(self):
+        words = ["Apple", "avocado", "", None, "Banana", "Åland"]
+        cached = FilterableList(words)
+        self.assertEqual(cached.filter_by_starting_character('a'), ["Apple", "avocado"])
+        self.assertEqual(cached.filter_by_starting_character('B'), ["Banana"])
+        self.assertEqual(cached.filter_by_starting_character('a'), ["Apple", "avocado"])
+        self.assertEqual(cached.filter_by_starting_character('a', True), ["avocado"])
+    
+    def test_cache_is_independent_of_source_list(self):
+        words = ["Apple", "Banana"]
+        cached = FilterableList(words)
+        words.append("Avocado")
+        self.assertEqual(cached.filter_by_starting_character('A'), ["Apple"])
+    
+    def test_non_ascii_first_characters_upper_case_to_ascii(self):
+        self.assertEqual(self.assertSameAsStringFilter(['ſtar', 'star'], 'S'), ['ſtar', 'star'])
+        self.assertEqual(self.assertSameAsStringFilter(['ıx', 'ix', 'Ix'], 'I'), ['ıx', 'ix', 'Ix'])
+        self.assertEqual(self.assertSameAsStringFilter(['ſtar', 'star'], 'ſ'), ['ſtar', 'star'])
+        self.assertEqual(self.assertSameAsStringFilter(['ßig', 'SSig', 'Sig'], 's'), ['SSig', 'Sig'])
+    
+    def test_non_ascii_character(self):
+        self.assertEqual(self.assertSameAsStringFilter(['Åland', 'åsa', 'Aland'], 'å'), ['Åland', 'åsa'])
+    
+    def test_case_sensitive(self):
+        words = ["Apple", "avocado", "ſtar", "star"]
+        self.assertEqual(self.assertSameAsStringFilter(words, 'a', True), ["avocado"])
+        self.assertEqual(self.assertSameAsStringFilter(words, 's', True), ["star"])
+    
+    def test_nul_character_does_not_match_empty(self):
+        self.assertEqual(self.assertSameAsStringFilter(['\x00a', '', None, 'a'], '\x00'), ['\x00a'])
+    
+    def test_invalid_character(self):
+        with self.assertRaises(ValueError):
+            FilterableList(["Apple"]).filter_by_starting_character("AB")
+
+
+@unittest.skipUnless(_filter_e is not None, "Cython extension _filter_e is not built")
+class TestCompiledFilterStartsE(unittest.TestCase):
+    """The compiled fast path agrees with the pure-Python rule"""
+    
+    def test_matches_pure_python(self):
+        words = ["Eagle", "bird", "", None, "elephant", "ÉE", "E"]
+        self.assertEqual(_filter_e.filter_starts_e(words), ["Eagle", "elephant", "E"])
+    
+    def test_str_subclass(self):
+        class Word(str):
+            pass
+        words = [Word("Emu"), Word("cat"), Word("")]
+        self.assertEqual(_filter_e.filter_starts_e(words), ["Emu"])
+    
+    def test_result_is_not_oversized(self):
+        result = _filter_e.filter_starts_e(["x"] * 100_000 + ["Eagle"])
+        self.assertEqual(result, ["Eagle"])
+        self.assertLess(sys.getsizeof(result), sys.getsizeof(["x"] * 1000))
+    
+    def test_non_str_entries_match_pure_python(self):
+        self.assertEqual(_filter_e.filter_starts_e(["Emu", 0, b"", "echo"]), ["Emu", "echo"])
+        with self.assertRaises(TypeError):
+            _filter_e.filter_starts_e(["Emu", 1])
+        with self.assertRaises(AttributeError):
+            _filter_e.filter_starts_e(["Emu", b"Eb"])
+
+
+if __name__ == "__main__":
+    unittest.main()